@@ -5,8 +5,11 @@
 
 import os
 import streamlit as st        # For building the web-based interactive UI
-import pandas as pd           # For creating and passing feature rows
+import numpy as np            # For building the encoded feature row
+import pandas as pd           # For the full-pipeline fallback row
 import joblib                 # For loading saved ML models
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder
 
 # Imports the adapter so that the Teacher's logic reflects extra features
 import rules_adapter as teacher
@@ -26,6 +29,72 @@ def load_model(mode: str):
     """
     return joblib.load(os.path.join(MODEL_DIR, f"{mode}.pkl"))
 
+def encode_row(model, inputs: dict):
+    """
+    Encodes a single input dictionary into the numeric row the classifier was
+    fitted on, so the per-interaction prediction skips building and transforming
+    a DataFrame. The column groups and their order are read from the fitted
+    ColumnTransformer; returns None when the preprocessing contains a step
+    other than passthrough or plain one-hot encoding, so the caller can fall
+    back to the full pipeline.
+    """
+    if len(model.steps) != 2 or not isinstance(model.steps[0][1], ColumnTransformer):
+        return None
+    pre, clf = model.steps[0][1], model.steps[1][1]
+
+    values = []
+    for _, transformer, columns in pre.transformers_:
+        if isinstance(transformer, str) and transformer == "drop":
+            continue
+        if isinstance(columns, str):
+            columns = [columns]
+        if not isinstance(columns, (list, tuple, np.ndarray)) or np.asarray(columns).dtype == bool:
+            return None  # Slices and boolean masks are not resolved here
+        # Integer selectors (e.g. a passthrough remainder) refer to input positions
+        columns = [pre.feature_names_in_[c] if isinstance(c, (int, np.integer)) else c for c in columns]
+
+        if (isinstance(transformer, str) and transformer == "passthrough") or (
+                isinstance(transformer, FunctionTransformer) and transformer.func is None):
+            values.extend(float(inputs[c]) for c in columns)
+        elif (isinstance(transformer, OneHotEncoder) and transformer.drop is None
+                and transformer.min_frequency is None and transformer.max_categories is None):
+            for column, levels in zip(columns, transformer.categories_):
+                values.extend(float(inputs[column] == level) for level in levels)
+        else:
+            return None  # Any other step must run through the pipeline itself
+
+    # Guards against silently feeding the classifier misaligned columns
+    if len(values) != clf.n_features_in_:
+        raise ValueError(
+            f"Encoded {len(values)} features but the classifier expects {clf.n_features_in_}"
+        )
+    return np.array([values], dtype=float)
+
+@st.cache_data(max_entries=1024)
+def decide(mode: str, name: str, child_present: int, left_risk: float, right_risk: float, speed_kph: int):
+    """
+    Returns the (Teacher, Student) decisions for one set of inputs.
+    Cached on the primitive inputs so reruns with unchanged values are free.
+    """
+    inputs = {
+        "name": name,
+        "child_present": child_present,
+        "left_risk": left_risk,
+        "right_risk": right_risk,
+        "speed_kph": speed_kph,
+    }
+    # Teacher decision using the rules_adapter logic
+    teacher_action = teacher.decide_action(mode, inputs)
+
+    # Student decision using the trained ML model
+    model = load_model(mode)
+    encoded = encode_row(model, inputs)
+    if encoded is not None:
+        student_action = model.steps[-1][1].predict(encoded)[0]
+    else:
+        student_action = model.predict(pd.DataFrame([inputs]))[0]
+    return teacher_action, str(student_action)
+
 # Page configuration for Streamlit
 st.set_page_config(page_title="Ethical AV Demo", layout="centered")
 st.title("Ethical AV Demo (Rule vs ML)")
@@ -49,22 +118,18 @@ with colC:
 # Speed input slider
 speed_kph = st.slider("Speed (kph)", 0, 70, 30, 1)
 
-# Creates a DataFrame row with the same schema as used in training
-row = pd.DataFrame([{
+# Collects the scenario inputs once as a plain dictionary
+inputs = {
     "name": name,
     "child_present": int(child_present),
     "left_risk": float(left_risk),
     "right_risk": float(right_risk),
     "speed_kph": int(speed_kph),
-}])
+}
 
 # --- Decision Section ---
-# Teacher decision using the rules_adapter logic
-teacher_action = teacher.decide_action(mode, row.iloc[0].to_dict())
-
-# Student decision using the trained ML model
-model = load_model(mode)
-student_action = model.predict(row)[0]
+# Teacher and Student decisions, memoized per input combination
+teacher_action, student_action = decide(mode, **inputs)
 
 # Displays Teacher vs Student decisions side-by-side
 c1, c2 = st.columns(2)
@@ -83,7 +148,7 @@ else:
 
 # Expander to show full scenario details
 with st.expander("Scenario details"):
-    st.json(row.iloc[0].to_dict())
+    st.json(inputs)
 
 # Caption explaining the relationship between Teacher and Student
 st.caption("Note: Adapter refines the original rules using extra features; the ML model learns to imitate the adapter.")
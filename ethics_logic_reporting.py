@@ -5,6 +5,10 @@
 # Each function accepts a dictionary containing a scenario description
 # and returns a driving action.
 
+# Scenario -> action overrides; any other scenario falls back to "brake"
+_UTILITARIAN = {"car_vs_car": "swerve"}
+_VIRTUE = {"car_vs_car": "slow down", "pedestrian_vs_pedestrian": "slow down"}
+
 def utilitarian_decision(scenario):
     """
     Utilitarian decision-making:
@@ -13,9 +17,7 @@ def utilitarian_decision(scenario):
         * If the scenario involves 'car_vs_car', the decision is to swerve.
         * In all other scenarios, the decision is to brake.
     """
-    if scenario["name"] == "car_vs_car":
-        return "swerve"
-    return "brake"
+    return _UTILITARIAN.get(scenario["name"], "brake")
 
 
 def deontological_decision(scenario):
@@ -36,6 +38,4 @@ def virtue_ethics_decision(scenario):
         * If the scenario is 'car_vs_car' or 'pedestrian_vs_pedestrian', slow down.
         * In all other cases, brake.
     """
-    if scenario["name"] in ["car_vs_car", "pedestrian_vs_pedestrian"]:
-        return "slow down"
-    return "brake"
+    return _VIRTUE.get(scenario["name"], "brake")
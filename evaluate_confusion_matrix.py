@@ -7,9 +7,9 @@
 
 import os
 import pandas as pd          # For dataset loading and DataFrame operations
-import numpy as np           # For numerical operations and unique label extraction
 import joblib                # For loading saved ML models
 from sklearn.metrics import confusion_matrix, ConfusionMatrixDisplay
+from sklearn import config_context
 import matplotlib.pyplot as plt  # For plotting confusion matrices
 
 # Create the "visualizations" folder if it doesn't exist
@@ -21,35 +21,50 @@ FEATURES = ["left_risk", "right_risk", "speed_kph", "name", "child_present"]
 # Ethical modes to evaluate (matching model filenames and datasets)
 MODES = ["utilitarian", "deontological", "virtue"]
 
+# (labeled dataset, trained model) paths for each mode, built once
+PATHS = {m: (f"labeled_data/{m}_labeled.csv", f"models/{m}.pkl") for m in MODES}
+
+# Output path of each mode's confusion matrix plot
+PLOT_PATHS = {m: os.path.join("visualizations", f"{m}_confusion_matrix.png") for m in MODES}
+
+# Every action the teacher can emit, in a fixed order so the confusion
+# matrix axes line up across modes
+ALL_ACTIONS = ["brake", "swerve_left", "swerve_right", "slow_down", "hold_lane"]
+
 # Iterate over each ethical mode
 for mode in MODES:
     print(f"\n=== {mode.capitalize()} Mode ===")
 
     # --- Load the labeled dataset for the current mode ---
-    df = pd.read_csv(f"labeled_data/{mode}_labeled.csv")
+    df = pd.read_csv(
+        PATHS[mode][0],
+        dtype={"name": "category", "action": "category"},
+        engine="pyarrow",
+    )
     X = df[FEATURES]                  # Feature columns
     y = df["action"].astype(str)      # Actual actions as strings
 
     # --- Load the corresponding trained ML model ---
-    model = joblib.load(f"models/{mode}.pkl")
+    model = joblib.load(PATHS[mode][1])
 
     # --- Make predictions on the full dataset ---
-    y_pred = model.predict(X)
+    # The labeled data is known to be finite, so skip that validation pass
+    with config_context(assume_finite=True):
+        y_pred = model.predict(X)
 
     # --- Compute confusion matrix ---
-    labels = np.unique(y)  # Ensure consistent label ordering
-    cm = confusion_matrix(y, y_pred, labels=labels)
+    cm = confusion_matrix(y, y_pred, labels=ALL_ACTIONS)
     print("Confusion Matrix (rows = actual, cols = predicted):")
-    print(pd.DataFrame(cm, index=labels, columns=labels))
+    print(pd.DataFrame(cm, index=ALL_ACTIONS, columns=ALL_ACTIONS))
 
     # --- Plot confusion matrix ---
     fig, ax = plt.subplots(figsize=(8, 6))
-    disp = ConfusionMatrixDisplay(confusion_matrix=cm, display_labels=labels)
+    disp = ConfusionMatrixDisplay(confusion_matrix=cm, display_labels=ALL_ACTIONS)
     disp.plot(cmap=plt.cm.Blues, ax=ax, values_format="d")
     plt.title(f"{mode.capitalize()} Mode Confusion Matrix", fontsize=14)
 
     # --- Save the plot to the visualizations folder ---
-    save_path = os.path.join("visualizations", f"{mode}_confusion_matrix.png")
+    save_path = PLOT_PATHS[mode]
     plt.savefig(save_path, dpi=300, bbox_inches="tight")
     print(f"✅ Saved confusion matrix to {save_path}")
 
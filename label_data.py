@@ -3,9 +3,10 @@
 # then uses the teacher model (rules_adapter) to assign an action label for each row.
 # One CSV file is created per ethical mode.
 
-import numpy as np          # For random number generation
+import numpy as np          # For random number generation and vectorized labeling
 import pandas as pd         # For DataFrame creation and CSV writing
 import os                   # For file and directory handling
+from joblib import Parallel, delayed  # For labeling the modes in parallel
 
 # Uses the adapter instead of directly importing ethics_engine
 # so that extra features (child_present, left_risk, etc.) actually influence decisions.
@@ -19,6 +20,31 @@ N_ROWS = 10000  # Number of synthetic rows to generate
 SCENARIOS = ["car_vs_pedestrian", "car_vs_car", "pedestrian_vs_pedestrian"]  # Scenario types
 MODES = ["utilitarian", "deontological", "virtue"]  # Ethical modes to label data for
 OUT_DIR = "labeled_data"  # Directory to save generated CSVs
+OUT_PATHS = {m: os.path.join(OUT_DIR, f"{m}_labeled.csv") for m in MODES}  # Output CSV per mode
+N_JOBS = 1  # Worker processes for per-mode labeling; raise for very large N_ROWS
+
+# ----------------------------
+# Vectorized teacher
+# ----------------------------
+def label_actions(mode: str, df: pd.DataFrame) -> np.ndarray:
+    """
+    Labels every row of the DataFrame in a single vectorized pass using
+    rules_adapter.refine_actions, so no per-row dict or Python call is needed.
+    """
+    names = df["name"].astype("category")
+
+    # Base action per scenario still comes from ethics_engine (via the adapter),
+    # evaluated once per category and broadcast through the integer codes
+    base = teacher.base_actions(mode, names.cat.categories)[names.cat.codes.to_numpy()]
+
+    return teacher.refine_actions(
+        mode,
+        base,
+        df["child_present"].to_numpy(),
+        np.clip(df["left_risk"].to_numpy(dtype=float), 0.0, 1.0),
+        np.clip(df["right_risk"].to_numpy(dtype=float), 0.0, 1.0),
+        df["speed_kph"].to_numpy(),
+    )
 
 # ----------------------------
 # Main script logic
@@ -32,31 +58,31 @@ if __name__ == "__main__":
 
     # Generates the synthetic dataset with richer features (no weather)
     df = pd.DataFrame({
-        "name": rng.choice(SCENARIOS, N_ROWS),       # Randomly pick one of the scenarios
+        # Randomly pick one of the scenarios, stored as a categorical column
+        "name": pd.Categorical(rng.choice(SCENARIOS, N_ROWS), categories=SCENARIOS),
         "child_present": rng.integers(0, 2, N_ROWS), # 0 = no child, 1 = child present
         "left_risk": rng.random(N_ROWS),             # Continuous value between 0.0 and 1.0
         "right_risk": rng.random(N_ROWS),            # Continuous value between 0.0 and 1.0
         "speed_kph": rng.integers(0, 71, N_ROWS),    # Speed in km/h between 0 and 70
     })
 
-    # Iterates over each ethical mode and labels the dataset separately
-    for mode in MODES:
-        actions = []  # Stores the decision for each row
-
-        # Iterates over all rows in the DataFrame
-        for _, row in df.iterrows():
-            # Converts the row to a dictionary and passes it to the teacher to get a decision
-            a = teacher.decide_action(mode, row.to_dict())
-            actions.append(a)
+    # Labels the dataset once per ethical mode; the modes are independent,
+    # so they can be fanned out across worker processes
+    labels = Parallel(n_jobs=N_JOBS, backend="loky")(
+        delayed(label_actions)(mode, df) for mode in MODES
+    )
 
-        # Creates a copy of the DataFrame to attach mode and action columns
-        out = df.copy()
-        out["mode"] = mode
-        out["action"] = actions
+    # Writes one labeled CSV per ethical mode
+    for mode, actions in zip(MODES, labels):
+        # Attaches (or overwrites) the mode and action columns on the shared
+        # DataFrame, so the features are never duplicated per mode
+        # (mode is a single-category column backed by int8 codes)
+        df["mode"] = pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), categories=[mode])
+        df["action"] = pd.Categorical(actions)
 
         # Saves the labeled dataset to a CSV file for the current mode
-        fname = os.path.join(OUT_DIR, f"{mode}_labeled.csv")
-        out.to_csv(fname, index=False)
+        fname = OUT_PATHS[mode]
+        df.to_csv(fname, index=False)
 
         # Prints confirmation with file path and row count
-        print(f"✅ wrote {fname} ({len(out)} rows)")
+        print(f"✅ wrote {fname} ({len(df)} rows)")
@@ -20,9 +20,10 @@ import joblib                     # For loading trained models
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import (
     accuracy_score, precision_score, recall_score, f1_score,
-    confusion_matrix, roc_auc_score
+    multilabel_confusion_matrix, roc_auc_score
 )
 from sklearn.preprocessing import label_binarize
+from sklearn import config_context
 
 # Features used in both training and evaluation
 FEATURES = ["left_risk", "right_risk", "speed_kph", "name", "child_present"]
@@ -30,6 +31,9 @@ FEATURES = ["left_risk", "right_risk", "speed_kph", "name", "child_present"]
 # Ethical modes corresponding to separate datasets and models
 MODES = ["utilitarian", "deontological", "virtue"]
 
+# (labeled dataset, trained model) paths for each mode, built once
+PATHS = {m: (f"labeled_data/{m}_labeled.csv", f"models/{m}.pkl") for m in MODES}
+
 # List to store evaluation results for all modes
 results = []
 
@@ -38,7 +42,11 @@ for mode in MODES:
     print(f"\n=== {mode.capitalize()} Mode ===")
 
     # --- Load dataset for the current mode ---
-    df = pd.read_csv(f"labeled_data/{mode}_labeled.csv")
+    df = pd.read_csv(
+        PATHS[mode][0],
+        dtype={"name": "category", "action": "category"},
+        engine="pyarrow",
+    )
     X = df[FEATURES]                  # Feature columns
     y = df["action"].astype(str)      # Actions converted to string
 
@@ -48,11 +56,17 @@ for mode in MODES:
     )
 
     # --- Load the trained model for the current mode ---
-    model = joblib.load(f"models/{mode}.pkl")
+    model = joblib.load(PATHS[mode][1])
 
     # --- Generate predictions and predicted probabilities ---
-    y_pred = model.predict(X_test)
-    y_proba = model.predict_proba(X_test)
+    # Transforms the test features once and walks the forest once; the labels
+    # are the most probable classes, exactly as RandomForest.predict derives them.
+    # The labeled data is known to be finite, so skip that check
+    with config_context(assume_finite=True):
+        X_test_enc = model.named_steps["pre"].transform(X_test)
+        clf = model.named_steps["clf"]
+        y_proba = clf.predict_proba(X_test_enc)
+    y_pred = np.asarray(clf.classes_)[y_proba.argmax(axis=1)]
 
     # --- Calculate standard metrics ---
     acc = accuracy_score(y_test, y_pred)
@@ -62,16 +76,9 @@ for mode in MODES:
 
     # --- Calculate specificity (macro-average) ---
     labels = np.unique(y_test)
-    cm = confusion_matrix(y_test, y_pred, labels=labels)
-    specifics = []
-    for k in range(len(labels)):
-        TP = cm[k, k]
-        FP = cm[:, k].sum() - TP
-        FN = cm[k, :].sum() - TP
-        TN = cm.sum() - (TP + FP + FN)
-        spec_k = TN / (TN + FP) if (TN + FP) > 0 else 0.0
-        specifics.append(spec_k)
-    specificity_macro = np.mean(specifics)
+    mcm = multilabel_confusion_matrix(y_test, y_pred, labels=labels)  # One 2x2 matrix per class
+    TN, FP = mcm[:, 0, 0], mcm[:, 0, 1]
+    specificity_macro = np.mean(TN / np.maximum(TN + FP, 1))  # TN + FP == 0 implies TN == 0
 
     # --- Calculate AUC-ROC (handle binary vs multiclass) ---
     if len(labels) == 2:
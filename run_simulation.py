@@ -27,21 +27,21 @@ ethics = {
 # Ensures that the "results" folder exists to store the CSV output
 os.makedirs("results", exist_ok=True)
 
+# Runs every ethical mode on every scenario and collects the result rows
+rows = [
+    (scenario["name"], mode_name, mode_func(scenario))
+    for scenario in scenarios
+    for mode_name, mode_func in ethics.items()
+]
+
 # Opens a CSV file for writing results
 with open("results/ethical_decision_log.csv", "w", newline="") as f:
     writer = csv.writer(f)
 
-    # Writes the CSV header row
+    # Writes the CSV header row followed by all result rows at once
     writer.writerow(["scenario", "mode", "decision"])
+    writer.writerows(rows)
 
-    # Iterates through each scenario and each ethical mode
-    for scenario in scenarios:
-        for mode_name, mode_func in ethics.items():
-            # Runs the corresponding decision function for this mode
-            decision = mode_func(scenario)
-
-            # Logs the scenario, mode, and resulting decision to the CSV file
-            writer.writerow([scenario["name"], mode_name, decision])
-
-            # Prints the decision to the console for quick verification
-            print(f"{scenario['name']} | {mode_name} => {decision}")
+# Prints each decision to the console for quick verification
+for scenario_name, mode_name, decision in rows:
+    print(f"{scenario_name} | {mode_name} => {decision}")
@@ -20,6 +20,12 @@ MODES = ["utilitarian", "deontological", "virtue"]
 DATA_DIR = "labeled_data"  # CSVs from label_data.py
 MODEL_DIR = "models"       # Where trained models will be saved
 
+# (labeled dataset, model output) paths for each mode, built once
+PATHS = {
+    m: (os.path.join(DATA_DIR, f"{m}_labeled.csv"), os.path.join(MODEL_DIR, f"{m}.pkl"))
+    for m in MODES
+}
+
 # List of features
 FEATURES_NUM = ["left_risk", "right_risk", "speed_kph"]  # Numeric inputs
 FEATURES_CAT = ["name", "child_present"]                 # Categorical inputs
@@ -32,7 +38,8 @@ if __name__ == "__main__":
     # Iterates over each ethical mode
     for mode in MODES:
         # Loads the corresponding labeled dataset
-        df = pd.read_csv(os.path.join(DATA_DIR, f"{mode}_labeled.csv"))
+        data_path, model_path = PATHS[mode]
+        df = pd.read_csv(data_path)
 
         # Splits into features (X) and target (y)
         X = df[FEATURES].copy()
@@ -79,6 +86,5 @@ if __name__ == "__main__":
         print(classification_report(yte, pipe.predict(Xte)))
 
         # Saves the trained pipeline to a .pkl file
-        model_path = os.path.join(MODEL_DIR, f"{mode}.pkl")
         joblib.dump(pipe, model_path)
         print(f"✅ saved {model_path}")